@@ -19,400 +19,578 @@ NotionページをMarkdown形式にエクスポートするツール。
 
 必要な環境変数:
     NOTION_API_TOKEN: NotionインテグレーションのAPIトークン
+
+任意の環境変数:
+    NOTION_MAX_CONCURRENCY: Notion APIへの同時リクエスト数の上限（デフォルト: 8）
 """
 
 import argparse
 import asyncio
+import importlib.util
 import os
+import re
+import stat
+import tempfile
+from collections.abc import Awaitable, Callable
+from typing import Any, TextIO, TypeVar
 
 from dotenv import load_dotenv
 
 from notion_py_client import NotionAsyncClient
-from notion_py_client.models.rich_text_item import rich_text_to_markdown
-from notion_py_client.utils import is_full_block
+from notion_py_client.blocks import BlockObject
+from notion_py_client.models.rich_text_item import (
+    RichTextItem,
+    rich_text_to_markdown,
+)
+from notion_py_client.utils import collect_paginated_api, is_full_block
 
 load_dotenv()  # Load environment variables from .env file
 
-client = NotionAsyncClient(auth=os.environ["NOTION_API_TOKEN"])
+
+def _read_max_concurrency() -> int:
+    """NOTION_MAX_CONCURRENCY を読み取り、1以上の整数であることを確認する
+
+    0 ではセマフォが永久に取得できずエクスポートが止まってしまうため、起動時に弾く。
+    """
+    raw = os.environ.get("NOTION_MAX_CONCURRENCY", "8")
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise SystemExit(
+            f"NOTION_MAX_CONCURRENCY must be an integer >= 1 (got {raw!r})"
+        )
+    return value
+
+
+# 並行変換で大量のリクエストが同時に飛ばないよう、API呼び出しの同時実行数を制限する
+# （Notion APIのレート制限で429が返るのを避けるため）
+_MAX_CONCURRENCY = _read_max_concurrency()
+_SEM = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+# 同時実行数と同じだけ接続を保持し、リクエストごとのTLSハンドシェイクを避ける。
+# h2 がインストールされていれば HTTP/2 で1本の接続に多重化する
+client = NotionAsyncClient(
+    auth=os.environ["NOTION_API_TOKEN"],
+    options={
+        "http2": importlib.util.find_spec("h2") is not None,
+        "max_connections": _MAX_CONCURRENCY,
+        "max_keepalive_connections": _MAX_CONCURRENCY,
+    },
+)
+
+T = TypeVar("T")
+
+
+async def _bounded(coro: Awaitable[T]) -> T:
+    """セマフォを取得してからAPI呼び出しを待機する"""
+    async with _SEM:
+        return await coro
+
+
+async def _list_children(block_id: str) -> list[BlockObject]:
+    """
+    ブロックの子要素を全ページ分取得する
+
+    `blocks.children.list` は1回あたり最大100件しか返さないため、
+    `next_cursor` をたどって残りのページも取得する。
+    カーソルは前のページの応答からしか得られないのでページ取得は逐次になるが、
+    取得した子要素の変換は呼び出し側で並行に行う。
+    """
+
+    async def list_page(**kwargs: Any):
+        return await _bounded(client.blocks.children.list(**kwargs))
+
+    children = await collect_paginated_api(list_page, {"block_id": block_id})
+    return [child for child in children if is_full_block(child)]
+
+
+# リッチテキスト配列 -> Markdown の変換結果キャッシュ。
+# ナビゲーションリンクや定型のコールアウト、表のヘッダーセルなど、
+# 同じ内容が何度も現れるページで再変換を省く
+_RICH_TEXT_CACHE_SIZE = 4096
+_rich_text_cache: dict[tuple[tuple[object, ...], ...], str] = {}
+
+
+def _rich_text_item_key(item: RichTextItem) -> tuple[object, ...]:
+    """Markdown変換の結果に影響するフィールドだけを取り出す"""
+    ann = item.annotations
+    return (
+        item.plain_text,
+        item.href,
+        ann.bold,
+        ann.italic,
+        ann.strikethrough,
+        ann.code,
+    )
+
+
+def _rich_text_md(rich_text: list[RichTextItem]) -> str:
+    """キャッシュ付きの rich_text_to_markdown"""
+    if not rich_text:
+        return ""
+    key = tuple(map(_rich_text_item_key, rich_text))
+    markdown = _rich_text_cache.get(key)
+    if markdown is None:
+        if len(_rich_text_cache) >= _RICH_TEXT_CACHE_SIZE:
+            # 最も古いエントリを捨てる（dictは挿入順を保持する）
+            del _rich_text_cache[next(iter(_rich_text_cache))]
+        markdown = _rich_text_cache[key] = rich_text_to_markdown(rich_text)
+    return markdown
+
+
+# 空でない行（直後の空行ごと）にマッチする。引用・コールアウトの子要素を
+# 1パスで "> " 付きの行に変換するために使う
+_NONEMPTY_LINE = re.compile(r"\n*^(.+)\n*", re.M)
+
+
+def _quote_lines(markdown: str, indent: str) -> str:
+    """空行を除いた各行の先頭に引用記号を付ける"""
+    if not markdown.strip("\n"):
+        return ""
+    return _NONEMPTY_LINE.sub(rf"{indent}> \g<1>\n", markdown)
+
+
+# ============================================
+# ブロックタイプごとのレンダラー
+# ============================================
+# 各レンダラーは (ブロック, インデント, 変換済みの子要素) を受け取り、
+# マークダウン文字列を返す純粋関数。文字列の += は再確保を繰り返すため、
+# 断片をリストに積んで最後に結合する
+
+
+# テキストブロック
+def _render_paragraph(block: BlockObject, indent: str, children_markdown: str) -> str:
+    text = _rich_text_md(block.paragraph.rich_text)
+    if not (text or children_markdown):
+        return ""
+    if children_markdown:
+        return f"{indent}{text}\n{children_markdown}"
+    return f"{indent}{text}\n\n"
+
+
+# テキスト1行で表せるブロックの (接頭辞, 接尾辞)。
+# 描画時に書式文字列を解釈せず、断片を並べて結合するだけで済ませる
+_BLOCK_FMT: dict[str, tuple[str, str]] = {
+    "heading_1": ("# ", "\n\n"),
+    "heading_2": ("## ", "\n\n"),
+    "heading_3": ("### ", "\n\n"),
+    "bulleted_list_item": ("- ", "\n"),
+    "numbered_list_item": ("1. ", "\n"),
+    "template": ("[Template: ", "]\n\n"),
+}
+
+
+def _render_prefixed(block: BlockObject, indent: str, children_markdown: str) -> str:
+    pre, suf = _BLOCK_FMT[block.type]
+    text = _rich_text_md(getattr(block, block.type).rich_text)
+    return "".join((indent, pre, text, suf, children_markdown))
+
+
+def _render_heading(block: BlockObject, indent: str, children_markdown: str) -> str:
+    content = getattr(block, block.type)
+    # トグル可能な見出しの場合
+    if content.is_toggleable and children_markdown:
+        pre = _BLOCK_FMT[block.type][0]
+        text = _rich_text_md(content.rich_text)
+        return "".join(
+            (
+                indent,
+                "<details>\n",
+                indent,
+                "<summary>",
+                pre,
+                text,
+                "</summary>\n\n",
+                children_markdown,
+                indent,
+                "</details>\n\n",
+            )
+        )
+    return _render_prefixed(block, indent, children_markdown)
+
+
+# ToDoブロック
+def _render_to_do(block: BlockObject, indent: str, children_markdown: str) -> str:
+    checked = "x" if block.to_do.checked else " "
+    text = _rich_text_md(block.to_do.rich_text)
+    return f"{indent}- [{checked}] {text}\n{children_markdown}"
+
+
+# 引用ブロック
+def _render_quote(block: BlockObject, indent: str, children_markdown: str) -> str:
+    text = _rich_text_md(block.quote.rich_text)
+    out = [f"{indent}> {text}\n"]
+    if children_markdown:
+        # 引用の中の子要素も引用として扱う
+        out.append(_quote_lines(children_markdown, indent))
+    out.append("\n")
+    return "".join(out)
+
+
+# トグルブロック
+def _render_toggle(block: BlockObject, indent: str, children_markdown: str) -> str:
+    text = _rich_text_md(block.toggle.rich_text)
+    out = [f"{indent}<details>\n{indent}<summary>{text}</summary>\n\n"]
+    out.append(children_markdown)
+    out.append(f"{indent}</details>\n\n")
+    return "".join(out)
+
+
+# コールアウトブロック
+def _render_callout(block: BlockObject, indent: str, children_markdown: str) -> str:
+    text = _rich_text_md(block.callout.rich_text)
+    icon = ""
+    if block.callout.icon:
+        if block.callout.icon.type == "emoji":
+            icon = block.callout.icon.emoji + " "
+    out = [f"{indent}> {icon}{text}\n"]
+    if children_markdown:
+        out.append(_quote_lines(children_markdown, indent))
+    out.append("\n")
+    return "".join(out)
+
+
+# コードブロック
+def _render_code(block: BlockObject, indent: str, children_markdown: str) -> str:
+    text = _rich_text_md(block.code.rich_text)
+    lang = block.code.language
+    return f"{indent}```{lang}\n{text}\n{indent}```\n\n{children_markdown}"
+
+
+# 数式ブロック
+def _render_equation(block: BlockObject, indent: str, children_markdown: str) -> str:
+    expression = block.equation.expression
+    return f"{indent}$$\n{expression}\n{indent}$$\n\n{children_markdown}"
+
+
+# 内容を持たず、常に同じ文字列になるブロック
+_STATIC_MARKDOWN: dict[str, str] = {
+    "divider": "---\n\n",
+    "table_of_contents": "[Table of Contents]\n\n",
+    "breadcrumb": "[Breadcrumb]\n\n",
+    "unsupported": "[Unsupported Block]\n\n",
+}
+
+
+def _render_static(block: BlockObject, indent: str, children_markdown: str) -> str:
+    return indent + _STATIC_MARKDOWN[block.type]
+
+
+# レイアウトブロック
+def _render_children_only(
+    block: BlockObject, indent: str, children_markdown: str
+) -> str:
+    # カラムリスト・カラム・オリジナルの同期ブロックは子要素をそのまま表示
+    return children_markdown
+
+
+# テーブル
+def _render_table(block: BlockObject, indent: str, children_markdown: str) -> str:
+    # テーブルは子要素（table_row）で構成される
+    if not children_markdown:
+        return ""
+    lines = children_markdown.strip().split("\n")
+    # 最初の行をヘッダーとして扱う
+    header = lines[0].strip()
+    # カラム数を数える
+    col_count = header.count("|") - 1
+    separator = indent + "|" + " --- |" * col_count
+
+    # ヘッダー、区切り線、その他の行を結合（空行は除く）
+    rows = "\n".join(indent + row for row in map(str.strip, lines[1:]) if row)
+    if rows:
+        return f"{indent}{header}\n{separator}\n{rows}\n\n"
+    return f"{indent}{header}\n{separator}\n\n"
+
+
+def _render_table_row(block: BlockObject, indent: str, children_markdown: str) -> str:
+    # テーブル行（インデントなしで出力）
+    cells = [_rich_text_md(cell) for cell in block.table_row.cells]
+    return f"| {' | '.join(cells)} |\n"
+
+
+# メディアブロック
+# 画像以外のメディアブロックの表示ラベル
+_MEDIA_LABEL = {"video": "Video", "file": "File", "pdf": "PDF", "audio": "Audio"}
+
+
+def _render_media(block: BlockObject, indent: str, children_markdown: str) -> str:
+    type_name = block.type
+    content = getattr(block, type_name)
+    url = content.url
+    if type_name == "file":
+        # fileブロックはキャプションではなくファイル名をラベルにする
+        caption = content.name or ""
+    else:
+        caption = _rich_text_md(content.caption) if content.caption else ""
+    if type_name == "image":
+        return f"{indent}![{caption or 'image'}]({url})\n\n{children_markdown}"
+    label = _MEDIA_LABEL[type_name]
+    return f"{indent}[{label}: {caption or type_name}]({url})\n\n{children_markdown}"
+
+
+def _render_bookmark(block: BlockObject, indent: str, children_markdown: str) -> str:
+    caption = _rich_text_md(block.bookmark.caption) if block.bookmark.caption else ""
+    url = block.bookmark.url
+    label = caption if caption else url
+    return f"{indent}[Bookmark: {label}]({url})\n\n{children_markdown}"
+
+
+def _render_embed(block: BlockObject, indent: str, children_markdown: str) -> str:
+    caption = _rich_text_md(block.embed.caption) if block.embed.caption else ""
+    url = block.embed.url
+    label = caption if caption else url
+    return f"{indent}[Embed: {label}]({url})\n\n{children_markdown}"
 
 
-async def convert_block_to_markdown(
-    block_id: str, indent_level: int = 0, debug: bool = False
+def _render_link_preview(
+    block: BlockObject, indent: str, children_markdown: str
+) -> str:
+    return f"{indent}[Link Preview]({block.link_preview.url})\n\n"
+
+
+# 特殊ブロック
+def _render_child_page(block: BlockObject, indent: str, children_markdown: str) -> str:
+    return f"{indent}[Page: {block.child_page.title}]\n\n{children_markdown}"
+
+
+def _render_child_database(
+    block: BlockObject, indent: str, children_markdown: str
+) -> str:
+    return f"{indent}[Database: {block.child_database.title}]\n\n{children_markdown}"
+
+
+def _render_link_to_page(
+    block: BlockObject, indent: str, children_markdown: str
+) -> str:
+    page_info = block.link_to_page
+    if page_info.page_id:
+        return f"{indent}[Link to Page](https://notion.so/{page_info.compact_id})\n\n"
+    if page_info.database_id:
+        return (
+            f"{indent}[Link to Database](https://notion.so/{page_info.compact_id})\n\n"
+        )
+    return ""
+
+
+def _render_unknown(block: BlockObject, indent: str, children_markdown: str) -> str:
+    # その他の未知のブロックタイプ
+    return f"{indent}[Unknown Block Type: {block.type}]\n\n{children_markdown}"
+
+
+Renderer = Callable[[BlockObject, str, str], str]
+
+# block.type -> レンダラー。elifの連鎖をたどらず1回の辞書引きで分岐する
+_HANDLERS: dict[str, Renderer] = {
+    "paragraph": _render_paragraph,
+    "heading_1": _render_heading,
+    "heading_2": _render_heading,
+    "heading_3": _render_heading,
+    "bulleted_list_item": _render_prefixed,
+    "numbered_list_item": _render_prefixed,
+    "to_do": _render_to_do,
+    "quote": _render_quote,
+    "toggle": _render_toggle,
+    "callout": _render_callout,
+    "code": _render_code,
+    "equation": _render_equation,
+    "divider": _render_static,
+    "column_list": _render_children_only,
+    "column": _render_children_only,
+    "table": _render_table,
+    "table_row": _render_table_row,
+    "image": _render_media,
+    "video": _render_media,
+    "file": _render_media,
+    "pdf": _render_media,
+    "audio": _render_media,
+    "bookmark": _render_bookmark,
+    "embed": _render_embed,
+    "link_preview": _render_link_preview,
+    "child_page": _render_child_page,
+    "child_database": _render_child_database,
+    "table_of_contents": _render_static,
+    "breadcrumb": _render_static,
+    "template": _render_prefixed,
+    # 参照側の同期ブロックは、変換前に同期元の内容を子要素として解決しておく
+    "synced_block": _render_children_only,
+    "link_to_page": _render_link_to_page,
+    "unsupported": _render_static,
+}
+
+
+# インデント文字列（2スペース単位）のキャッシュ。深さの種類は少ないので
+# ブロックごとに "  " * n を作り直さず、同じ文字列オブジェクトを使い回す
+_INDENT_CACHE: list[str] = ["", "  ", "    ", "      ", "        "]
+
+
+def _indent(level: int) -> str:
+    """インデントレベルに対応するインデント文字列を返す"""
+    while level >= len(_INDENT_CACHE):
+        _INDENT_CACHE.append(_INDENT_CACHE[-1] + "  ")
+    return _INDENT_CACHE[level]
+
+
+# ブロックID -> 子ブロックの一覧。ページ全体を取得してから描画に使う
+BlockTree = dict[str, list[BlockObject]]
+
+# 同期ブロック参照の変換結果キャッシュ: (同期元ブロックID, インデントレベル) -> マークダウン
+SyncedCache = dict[tuple[str, int], str]
+
+
+def _children_source(block: BlockObject) -> str | None:
+    """
+    ブロックの子要素をどのIDから取得するかを返す
+
+    参照側の同期ブロックは同期元ブロックの子要素をそのまま表示するため、
+    同期元のIDから子要素を取得する（同期元ブロック自体を取得する必要はない）。
+    """
+    if block.type == "synced_block" and block.synced_block.synced_from:
+        return block.synced_block.synced_from.block_id
+    if block.has_children:
+        return block.id
+    return None
+
+
+async def fetch_block_tree(page_id: str) -> BlockTree:
+    """
+    ページ配下のブロックを階層ごとにまとめて取得する
+
+    1階層分のブロック（フロンティア）の子要素を `asyncio.gather` で一度に取得し、
+    次の階層へ進む。葉ごとに再帰して待つのではなく階層単位でリクエストを並べるため、
+    ネットワークの同時実行数を上限まで使い切れる。
+
+    Args:
+        page_id: 取得するページのID
+
+    Returns:
+        ブロックID（参照側の同期ブロックは同期元ID）から子ブロック一覧へのマップ
+    """
+    tree: BlockTree = {}
+    frontier = [page_id]
+    while frontier:
+        results = await asyncio.gather(*[_list_children(b) for b in frontier])
+        tree.update(zip(frontier, results))
+
+        next_frontier: list[str] = []
+        for children in results:
+            for child in children:
+                source = _children_source(child)
+                # 同じ同期元が複数回参照されていても取得は1回だけ
+                if source is not None and source not in tree:
+                    tree[source] = []
+                    next_frontier.append(source)
+        frontier = next_frontier
+    return tree
+
+
+def convert_block_to_markdown(
+    block: BlockObject,
+    tree: BlockTree,
+    indent_level: int = 0,
+    synced_cache: SyncedCache | None = None,
 ) -> str:
     """
     Notionブロックをマークダウンに変換する
 
+    子要素は `fetch_block_tree` で取得済みのツリーから読み出し、
+    先に子要素を変換してから親ブロックを描画する（後行順）。
+
     Args:
-        block_id: 変換するブロックのID
+        block: 変換するブロック
+        tree: `fetch_block_tree` で取得したブロックツリー
         indent_level: インデントレベル（ネストされた要素用）
-        debug: デバッグモード
+        synced_cache: 同期ブロック参照の変換結果キャッシュ（エクスポート単位で共有）
 
     Returns:
         マークダウン形式の文字列
     """
-    block = await client.blocks.retrieve(block_id=block_id)
+    if synced_cache is None:
+        synced_cache = {}
 
-    if not is_full_block(block):
-        return ""
-
-    indent = "  " * indent_level  # 2スペースでインデント
+    indent = _indent(indent_level)
+    source = _children_source(block)
     children_markdown = ""
 
-    # 子要素を持つ場合は再帰的に処理
-    if block.has_children:
-        children = await client.blocks.children.list(block_id=block_id)
-
-        for i, child in enumerate(children.results):
-            if is_full_block(child):
-                # 子要素のインデントレベルを決定
-                child_indent = indent_level + 1
-                child_md = await convert_block_to_markdown(
-                    child.id, child_indent, debug
-                )
-                children_markdown += child_md
-
-    # ブロックタイプごとにマークダウンを生成
-    result = ""
-
-    # テキストブロック
-    if block.type == "paragraph":
-        text = rich_text_to_markdown(block.paragraph.rich_text)
-        if text or children_markdown:
-            result = f"{indent}{text}\n"
-            if children_markdown:
-                result += children_markdown
-            result += "\n" if not children_markdown else ""
-
-    elif block.type == "heading_1":
-        text = rich_text_to_markdown(block.heading_1.rich_text)
-        # トグル可能な見出しの場合
-        if block.heading_1.is_toggleable and children_markdown:
-            result = f"{indent}<details>\n{indent}<summary># {text}</summary>\n\n"
-            result += children_markdown
-            result += f"{indent}</details>\n\n"
-        else:
-            result = f"{indent}# {text}\n\n"
-            if children_markdown:
-                result += children_markdown
-
-    elif block.type == "heading_2":
-        text = rich_text_to_markdown(block.heading_2.rich_text)
-        # トグル可能な見出しの場合
-        if block.heading_2.is_toggleable and children_markdown:
-            result = f"{indent}<details>\n{indent}<summary>## {text}</summary>\n\n"
-            result += children_markdown
-            result += f"{indent}</details>\n\n"
-        else:
-            result = f"{indent}## {text}\n\n"
-            if children_markdown:
-                result += children_markdown
-
-    elif block.type == "heading_3":
-        text = rich_text_to_markdown(block.heading_3.rich_text)
-        # トグル可能な見出しの場合
-        if block.heading_3.is_toggleable and children_markdown:
-            result = f"{indent}<details>\n{indent}<summary>### {text}</summary>\n\n"
-            result += children_markdown
-            result += f"{indent}</details>\n\n"
-        else:
-            result = f"{indent}### {text}\n\n"
-            if children_markdown:
-                result += children_markdown
-
-    # リストブロック
-    elif block.type == "bulleted_list_item":
-        text = rich_text_to_markdown(block.bulleted_list_item.rich_text)
-        result = f"{indent}- {text}\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "numbered_list_item":
-        text = rich_text_to_markdown(block.numbered_list_item.rich_text)
-        result = f"{indent}1. {text}\n"
-        if children_markdown:
-            result += children_markdown
-
-    # ToDoブロック
-    elif block.type == "to_do":
-        checked = "x" if block.to_do.checked else " "
-        text = rich_text_to_markdown(block.to_do.rich_text)
-        result = f"{indent}- [{checked}] {text}\n"
-        if children_markdown:
-            result += children_markdown
-
-    # 引用ブロック
-    elif block.type == "quote":
-        text = rich_text_to_markdown(block.quote.rich_text)
-        result = f"{indent}> {text}\n"
-        if children_markdown:
-            # 引用の中の子要素も引用として扱う
-            for line in children_markdown.split("\n"):
-                if line:
-                    result += f"{indent}> {line}\n"
-        result += "\n"
-
-    # トグルブロック
-    elif block.type == "toggle":
-        text = rich_text_to_markdown(block.toggle.rich_text)
-        result = f"{indent}<details>\n{indent}<summary>{text}</summary>\n\n"
-        if children_markdown:
-            result += children_markdown
-        result += f"{indent}</details>\n\n"
-
-    # コールアウトブロック
-    elif block.type == "callout":
-        text = rich_text_to_markdown(block.callout.rich_text)
-        icon = ""
-        if block.callout.icon:
-            if block.callout.icon.type == "emoji":
-                icon = block.callout.icon.emoji + " "
-        result = f"{indent}> {icon}{text}\n"
-        if children_markdown:
-            for line in children_markdown.split("\n"):
-                if line:
-                    result += f"{indent}> {line}\n"
-        result += "\n"
-
-    # コードブロック
-    elif block.type == "code":
-        text = rich_text_to_markdown(block.code.rich_text)
-        lang = block.code.language
-        result = f"{indent}```{lang}\n{text}\n{indent}```\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    # 数式ブロック
-    elif block.type == "equation":
-        result = f"{indent}$$\n{block.equation.expression}\n{indent}$$\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    # 区切り線
-    elif block.type == "divider":
-        result = f"{indent}---\n\n"
-
-    # レイアウトブロック
-    elif block.type == "column_list":
-        # カラムリストは子要素（カラム）をそのまま表示
-        if children_markdown:
-            result = children_markdown
-
-    elif block.type == "column":
-        # カラムの内容をそのまま表示
-        if children_markdown:
-            result = children_markdown
-
-    # テーブル
-    elif block.type == "table":
-        # テーブルは子要素（table_row）で構成される
-        if children_markdown:
-            lines = children_markdown.strip().split("\n")
-            if len(lines) > 0:
-                # 最初の行をヘッダーとして扱う
-                header = lines[0].strip()
-                # カラム数を数える
-                col_count = header.count("|") - 1
-                separator = indent + "|" + " --- |" * col_count
-
-                # ヘッダー、区切り線、その他の行を結合
-                result = indent + header + "\n" + separator + "\n"
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        if line.strip():
-                            result += indent + line.strip() + "\n"
-                result += "\n"
-
-    elif block.type == "table_row":
-        # テーブル行（インデントなしで出力）
-        cells = [rich_text_to_markdown(cell) for cell in block.table_row.cells]
-        result = f"| {' | '.join(cells)} |\n"
-
-    # メディアブロック
-    elif block.type == "image":
-        caption = (
-            rich_text_to_markdown(block.image.caption) if block.image.caption else ""
-        )
-        url = (
-            block.image.external.url
-            if block.image.type == "external"
-            else block.image.file.url
-        )
-        alt_text = caption if caption else "image"
-        result = f"{indent}![{alt_text}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "video":
-        caption = (
-            rich_text_to_markdown(block.video.caption) if block.video.caption else ""
-        )
-        url = (
-            block.video.external.url
-            if block.video.type == "external"
-            else block.video.file.url
-        )
-        result = f"{indent}[Video: {caption if caption else 'video'}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "file":
-        caption = block.file.name if block.file.name else ""
-        url = (
-            block.file.external.url
-            if block.file.type == "external"
-            else block.file.file.url
-        )
-        result = f"{indent}[File: {caption if caption else 'file'}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "pdf":
-        caption = rich_text_to_markdown(block.pdf.caption) if block.pdf.caption else ""
-        url = (
-            block.pdf.external.url
-            if block.pdf.type == "external"
-            else block.pdf.file.url
+    if source is not None and source != block.id:
+        # 参照側の同期ブロック: 同期元の子要素をそのまま表示する
+        # 同じ同期ブロックが複数箇所で参照されても変換は1回だけ行う
+        key = (source, indent_level)
+        if key not in synced_cache:
+            synced_cache[key] = _convert_children(
+                tree[source], tree, indent_level + 1, synced_cache
+            )
+        children_markdown = synced_cache[key]
+    elif source is not None:
+        children_markdown = _convert_children(
+            tree[source], tree, indent_level + 1, synced_cache
         )
-        result = f"{indent}[PDF: {caption if caption else 'pdf'}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
 
-    elif block.type == "audio":
-        caption = (
-            rich_text_to_markdown(block.audio.caption) if block.audio.caption else ""
-        )
-        url = (
-            block.audio.external.url
-            if block.audio.type == "external"
-            else block.audio.file.url
-        )
-        result = f"{indent}[Audio: {caption if caption else 'audio'}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "bookmark":
-        caption = (
-            rich_text_to_markdown(block.bookmark.caption)
-            if block.bookmark.caption
-            else ""
-        )
-        url = block.bookmark.url
-        result = f"{indent}[Bookmark: {caption if caption else url}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "embed":
-        caption = (
-            rich_text_to_markdown(block.embed.caption) if block.embed.caption else ""
-        )
-        url = block.embed.url
-        result = f"{indent}[Embed: {caption if caption else url}]({url})\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "link_preview":
-        url = block.link_preview.url
-        result = f"{indent}[Link Preview]({url})\n\n"
-
-    # 特殊ブロック
-    elif block.type == "child_page":
-        result = f"{indent}[Page: {block.child_page.title}]\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "child_database":
-        result = f"{indent}[Database: {block.child_database.title}]\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "table_of_contents":
-        result = f"{indent}[Table of Contents]\n\n"
-
-    elif block.type == "breadcrumb":
-        result = f"{indent}[Breadcrumb]\n\n"
-
-    elif block.type == "template":
-        text = rich_text_to_markdown(block.template.rich_text)
-        result = f"{indent}[Template: {text}]\n\n"
-        if children_markdown:
-            result += children_markdown
-
-    elif block.type == "synced_block":
-        # 同期ブロックの処理
-        if block.synced_block.synced_from:
-            synced_block_id = block.synced_block.synced_from.block_id
-            synced_content = await convert_block_to_markdown(
-                synced_block_id, indent_level, debug
-            )
-            result = synced_content
-        else:
-            # オリジナルの同期ブロック
-            if children_markdown:
-                result = children_markdown
-
-    elif block.type == "link_to_page":
-        page_info = block.link_to_page
-        if page_info.page_id:
-            result = f"{indent}[Link to Page](https://notion.so/{page_info.page_id.replace('-', '')})\n\n"
-        elif page_info.database_id:
-            result = f"{indent}[Link to Database](https://notion.so/{page_info.database_id.replace('-', '')})\n\n"
-
-    # 未サポートのブロック
-    elif block.type == "unsupported":
-        result = f"{indent}[Unsupported Block]\n\n"
+    # ブロックタイプごとのレンダラーでマークダウンを生成
+    handler = _HANDLERS.get(block.type, _render_unknown)
+    return handler(block, indent, children_markdown)
 
-    else:
-        # その他の未知のブロックタイプ
-        result = f"{indent}[Unknown Block Type: {block.type}]\n\n"
-        if children_markdown:
-            result += children_markdown
 
-    return result
+def _convert_children(
+    children: list[BlockObject],
+    tree: BlockTree,
+    indent_level: int,
+    synced_cache: SyncedCache,
+) -> str:
+    """子ブロックを順に変換して連結する"""
+    return "".join(
+        convert_block_to_markdown(child, tree, indent_level, synced_cache)
+        for child in children
+    )
 
 
 async def export_page_as_markdown(
-    page_id: str, output_file: str = None, debug: bool = False
-) -> str:
+    page_id: str, sink: TextIO, debug: bool = False
+) -> None:
     """
     Notionページ全体をマークダウンにエクスポートする
 
+    ドキュメント全体を1つの文字列に組み立てず、トップレベルのブロックを
+    変換するたびに `sink` へ書き出す。
+
     Args:
         page_id: エクスポートするページのID
-        output_file: 出力ファイルパス（オプション）
+        sink: 書き出し先（ファイルや `io.StringIO` など）
         debug: デバッグモード
-
-    Returns:
-        マークダウン形式の文字列
     """
-    # ページ情報を取得
-    page = await client.pages.retrieve({"page_id": page_id})
+    # ページ情報とページ配下のブロックツリーを並行して取得
+    page, tree = await asyncio.gather(
+        _bounded(client.pages.retrieve({"page_id": page_id})),
+        fetch_block_tree(page_id),
+    )
 
     # ページタイトルを取得
     for property in page.properties.values():
         if property.type == "title":
-            title = rich_text_to_markdown(property.title)
+            title = _rich_text_md(property.title)
             break
     else:
         title = ""
-    markdown = f"# {title}\n\n"
+    sink.write(f"# {title}\n\n")
 
-    # ページの子ブロックを取得
-    children = await client.blocks.children.list(block_id=page_id)
+    synced_cache: SyncedCache = {}
+    for child in tree[page_id]:
+        sink.write(convert_block_to_markdown(child, tree, 0, synced_cache))
 
-    for child in children.results:
-        if is_full_block(child):
-            child_markdown = await convert_block_to_markdown(
-                child.id, indent_level=0, debug=debug
-            )
-            markdown += child_markdown
 
-    # ファイルに出力
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(markdown)
-        print(f"マークダウンファイルを出力しました: {output_file}")
+def _output_file_mode(path: str) -> int:
+    """出力ファイルに付けるパーミッションを返す
 
-    return markdown
+    既存ファイルがあればそのモードを引き継ぎ、なければ通常の open と同じく umask に従う。
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 if __name__ == "__main__":
@@ -421,4 +599,25 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, required=False, default="output.md")
     parser.add_argument("--debug", action="store_true", default=False)
     args = parser.parse_args()
-    asyncio.run(export_page_as_markdown(args.page_id, args.output, args.debug))
+    # 同じディレクトリの一時ファイルに書き出し、成功したときだけ出力先に置き換える。
+    # API呼び出しが失敗しても既存の出力ファイルは壊さない。
+    # 大きめのバッファで細かい書き込みをまとめてからディスクに出力する
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        buffering=1 << 20,
+        dir=output_dir,
+        suffix=".tmp",
+        delete=False,
+    ) as sink:
+        try:
+            asyncio.run(export_page_as_markdown(args.page_id, sink, args.debug))
+        except BaseException:
+            sink.close()
+            os.remove(sink.name)
+            raise
+    # NamedTemporaryFile は 0600 で作られるため、置き換える前にモードを合わせる
+    os.chmod(sink.name, _output_file_mode(args.output))
+    os.replace(sink.name, args.output)
+    print(f"マークダウンファイルを出力しました: {args.output}")
@@ -53,6 +53,7 @@ from .media_blocks import (
     LinkPreviewBlock,
 )
 from .unsupported import UnsupportedBlock
+from .markdown import block_to_markdown, blocks_to_markdown, render_all
 
 # Union type for all block types with discriminator
 BlockObject = Annotated[
@@ -143,4 +144,8 @@ __all__ = [
     "LinkPreviewBlock",
     # Unsupported
     "UnsupportedBlock",
+    # Markdown
+    "block_to_markdown",
+    "blocks_to_markdown",
+    "render_all",
 ]
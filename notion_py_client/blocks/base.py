@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, StrictBool, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 
 from ..models.parent import NotionParent
 from ..models.user import PartialUser
@@ -82,8 +82,15 @@ class BaseBlockObject(BaseModel):
 
     各ブロックタイプは、このクラスを継承し、
     `type`フィールドをLiteralで定義します。
+
+    APIレスポンスから読み取るだけのモデルなのでイミュータブルにしておき、
+    代入時の検証処理を持たせない。
+    ただし `frozen=True` が禁止するのはフィールドの再代入だけで、
+    `rich_text` などのリストフィールドの中身は変更できてしまう点に注意。
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     object: Literal["block"] = Field("block", description="オブジェクトタイプ")
     id: StrictStr = Field(..., description="ブロックID")
     # type field is defined in each subclass with specific Literal
@@ -96,6 +103,17 @@ class BaseBlockObject(BaseModel):
     in_trash: StrictBool = Field(False, description="ゴミ箱フラグ")
 
 
+class BlockContent(BaseModel):
+    """
+    ブロック固有コンテンツ（`paragraph`, `code` など）の基底クラス
+
+    ブロック本体と同様にイミュータブルにする（浅いイミュータブルで、
+    リストフィールドの要素の追加・削除は防げない）。
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
 class PartialBlock(BaseModel):
     """部分的なブロック情報"""
 
@@ -8,9 +8,9 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, StrictBool, StrictInt, StrictStr
+from pydantic import Field, StrictBool, StrictInt, StrictStr
 
-from .base import ApiColor, BaseBlockObject
+from .base import ApiColor, BaseBlockObject, BlockContent
 from ..models.rich_text_item import RichTextItem, rich_text_to_markdown
 
 
@@ -19,19 +19,19 @@ from ..models.rich_text_item import RichTextItem, rich_text_to_markdown
 # ============================================
 
 
-class EmptyObject(BaseModel):
+class EmptyObject(BlockContent):
     """空のオブジェクト"""
 
     pass
 
 
-class TableOfContentsContent(BaseModel):
+class TableOfContentsContent(BlockContent):
     """目次コンテンツ"""
 
     color: ApiColor = Field(..., description="カラー設定")
 
 
-class ColumnContent(BaseModel):
+class ColumnContent(BlockContent):
     """カラムコンテンツ"""
 
     width_ratio: float | None = Field(
@@ -40,7 +40,7 @@ class ColumnContent(BaseModel):
     )
 
 
-class LinkToPageContent(BaseModel):
+class LinkToPageContent(BlockContent):
     """ページへのリンクコンテンツ"""
 
     type: Literal["page_id", "database_id", "comment_id"] = Field(
@@ -50,8 +50,19 @@ class LinkToPageContent(BaseModel):
     database_id: StrictStr | None = Field(None, description="データベースID")
     comment_id: StrictStr | None = Field(None, description="コメントID")
 
+    @property
+    def compact_id(self) -> str | None:
+        """リンク先IDからハイフンを除いたもの（notion.so のURL形式）
 
-class TableContent(BaseModel):
+        page_id, database_id, comment_id の順で最初に設定されているIDを使う。
+        `model_copy(update=...)` で作った別インスタンスでも古い値を返さないよう、
+        キャッシュせず毎回計算する。
+        """
+        target_id = self.page_id or self.database_id or self.comment_id
+        return target_id.replace("-", "") if target_id else None
+
+
+class TableContent(BlockContent):
     """テーブルコンテンツ"""
 
     has_column_header: StrictBool = Field(..., description="列ヘッダーの有無")
@@ -59,7 +70,7 @@ class TableContent(BaseModel):
     table_width: StrictInt = Field(..., description="テーブルの幅")
 
 
-class TableRowContent(BaseModel):
+class TableRowContent(BlockContent):
     """テーブル行コンテンツ"""
 
     cells: list[list[RichTextItem]] = Field(..., description="セル配列（2次元配列）")
@@ -152,12 +163,13 @@ class LinkToPageBlock(BaseBlockObject):
 
     def to_markdown(self) -> str:
         """ページへのリンクブロックをMarkdown形式に変換"""
-        if self.link_to_page.page_id:
-            return f"[Page Link](https://notion.so/{self.link_to_page.page_id.replace('-', '')})"
-        elif self.link_to_page.database_id:
-            return f"[Database Link](https://notion.so/{self.link_to_page.database_id.replace('-', '')})"
-        elif self.link_to_page.comment_id:
-            return f"[Comment Link](https://notion.so/comment/{self.link_to_page.comment_id.replace('-', '')})"
+        link = self.link_to_page
+        if link.page_id:
+            return f"[Page Link](https://notion.so/{link.compact_id})"
+        elif link.database_id:
+            return f"[Database Link](https://notion.so/{link.compact_id})"
+        elif link.comment_id:
+            return f"[Comment Link](https://notion.so/comment/{link.compact_id})"
         return ""
 
 
@@ -0,0 +1,163 @@
+"""
+ブロックのMarkdown変換
+
+`block.type` をキーにした関数テーブルで各ブロッククラスの `to_markdown` を呼び分ける。
+ブロックごとのメソッド解決と bound method の生成を省き、
+大量のブロックを変換するループを辞書引き1回で回せるようにする。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .base import BaseBlockObject, PartialBlock
+from .layout_blocks import (
+    BreadcrumbBlock,
+    ColumnBlock,
+    ColumnListBlock,
+    DividerBlock,
+    LinkToPageBlock,
+    TabBlock,
+    TableBlock,
+    TableOfContentsBlock,
+    TableRowBlock,
+)
+from .media_blocks import (
+    AudioBlock,
+    BookmarkBlock,
+    EmbedBlock,
+    FileBlock,
+    ImageBlock,
+    LinkPreviewBlock,
+    PdfBlock,
+    VideoBlock,
+)
+from .special_blocks import (
+    CalloutBlock,
+    ChildDatabaseBlock,
+    ChildPageBlock,
+    CodeBlock,
+    EquationBlock,
+    MeetingNotesBlock,
+    SyncedBlockBlock,
+)
+from .text_blocks import (
+    BulletedListItemBlock,
+    Heading1Block,
+    Heading2Block,
+    Heading3Block,
+    Heading4Block,
+    NumberedListItemBlock,
+    ParagraphBlock,
+    QuoteBlock,
+    TemplateBlock,
+    ToDoBlock,
+    ToggleBlock,
+)
+from .unsupported import UnsupportedBlock
+
+BlockRenderer = Callable[[Any], str]
+
+# block.type -> Markdown変換関数（クラスに定義された to_markdown をそのまま使う）
+_RENDERERS: dict[str, BlockRenderer] = {
+    # Text blocks
+    "paragraph": ParagraphBlock.to_markdown,
+    "heading_1": Heading1Block.to_markdown,
+    "heading_2": Heading2Block.to_markdown,
+    "heading_3": Heading3Block.to_markdown,
+    "heading_4": Heading4Block.to_markdown,
+    "bulleted_list_item": BulletedListItemBlock.to_markdown,
+    "numbered_list_item": NumberedListItemBlock.to_markdown,
+    "quote": QuoteBlock.to_markdown,
+    "to_do": ToDoBlock.to_markdown,
+    "toggle": ToggleBlock.to_markdown,
+    "template": TemplateBlock.to_markdown,
+    # Special blocks
+    "synced_block": SyncedBlockBlock.to_markdown,
+    "child_page": ChildPageBlock.to_markdown,
+    "child_database": ChildDatabaseBlock.to_markdown,
+    "equation": EquationBlock.to_markdown,
+    "code": CodeBlock.to_markdown,
+    "callout": CalloutBlock.to_markdown,
+    "meeting_notes": MeetingNotesBlock.to_markdown,
+    # Layout blocks
+    "divider": DividerBlock.to_markdown,
+    "breadcrumb": BreadcrumbBlock.to_markdown,
+    "table_of_contents": TableOfContentsBlock.to_markdown,
+    "column_list": ColumnListBlock.to_markdown,
+    "column": ColumnBlock.to_markdown,
+    "tab": TabBlock.to_markdown,
+    "link_to_page": LinkToPageBlock.to_markdown,
+    "table": TableBlock.to_markdown,
+    "table_row": TableRowBlock.to_markdown,
+    # Media blocks
+    "embed": EmbedBlock.to_markdown,
+    "bookmark": BookmarkBlock.to_markdown,
+    "image": ImageBlock.to_markdown,
+    "video": VideoBlock.to_markdown,
+    "pdf": PdfBlock.to_markdown,
+    "file": FileBlock.to_markdown,
+    "audio": AudioBlock.to_markdown,
+    "link_preview": LinkPreviewBlock.to_markdown,
+    # Unsupported
+    "unsupported": UnsupportedBlock.to_markdown,
+}
+
+
+def _renderer_for(block: BaseBlockObject | PartialBlock) -> BlockRenderer:
+    """ブロックに対応するMarkdown変換関数を返す
+
+    PartialBlock や変換関数が登録されていないブロックタイプは、
+    空文字で黙って読み飛ばさずに例外を送出する。
+    """
+    if isinstance(block, PartialBlock):
+        raise TypeError(
+            f"PartialBlock {block.id!r} has no type and cannot be converted to "
+            "Markdown; filter it out or use render_all"
+        )
+    try:
+        return _RENDERERS[block.type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No Markdown converter is registered for block type {block.type!r}"
+        ) from None
+
+
+def block_to_markdown(block: BaseBlockObject) -> str:
+    """ブロックをMarkdown形式に変換
+
+    Raises:
+        TypeError: PartialBlock が渡された場合
+        NotImplementedError: 変換関数が登録されていないブロックタイプの場合
+    """
+    return _renderer_for(block)(block)
+
+
+def blocks_to_markdown(blocks: Iterable[BaseBlockObject]) -> list[str]:
+    """ブロック列をまとめてMarkdown形式に変換（1ブロックにつき1要素）
+
+    PartialBlock を含む `ListBlockChildrenResponse.results` は `render_all` に渡すか、
+    PartialBlock を取り除いてから渡すこと。
+
+    Raises:
+        TypeError: PartialBlock が含まれている場合
+        NotImplementedError: 変換関数が登録されていないブロックタイプが含まれている場合
+    """
+    return [_renderer_for(block)(block) for block in blocks]
+
+
+def render_all(
+    results: Iterable[BaseBlockObject | PartialBlock], separator: str = "\n\n"
+) -> str:
+    """ブロック列を1つのMarkdown文字列に変換
+
+    `ListBlockChildrenResponse.results` をそのまま渡せる（PartialBlock は読み飛ばす）。
+    子ブロックは取得しないため、列やトグルの中身は含まれない。
+    変換結果が空文字のブロック（`column_list` や `synced_block` など）は連結しない。
+    隣り合う段落が1つの段落にまとまらないよう、既定では空行で区切る。
+    """
+    rendered = blocks_to_markdown(
+        block for block in results if isinstance(block, BaseBlockObject)
+    )
+    return separator.join([markdown for markdown in rendered if markdown])
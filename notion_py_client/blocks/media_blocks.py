@@ -6,12 +6,12 @@ Embed, Bookmark, Image, Video, PDF, File, Audio, LinkPreview
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, StrictStr
+from pydantic import Field, StrictStr
 
-from .base import BaseBlockObject
-from ..models.rich_text_item import RichTextItem
+from .base import BaseBlockObject, BlockContent
+from ..models.rich_text_item import RichTextItem, rich_text_to_markdown
 from ..models.file import InternalFile
 
 
@@ -24,41 +24,53 @@ MediaFileType = Literal["external", "file"]
 # ============================================
 
 
-class MediaContentWithUrlAndCaption(BaseModel):
+class MediaContentWithUrlAndCaption(BlockContent):
     """URLとキャプションを持つメディアコンテンツ"""
 
     url: StrictStr = Field(..., description="URL")
     caption: list[RichTextItem] = Field(..., description="キャプション")
 
 
-class ExternalFileReference(BaseModel):
+class ExternalFileReference(BlockContent):
     """外部ファイル参照"""
 
     url: StrictStr = Field(..., description="URL")
 
 
-class ExternalMediaContentWithFileAndCaption(BaseModel):
+class ExternalMediaContentWithFileAndCaption(BlockContent):
     """外部ファイルとキャプションを持つメディアコンテンツ"""
 
     type: Literal["external"] = Field("external", description="ファイルタイプ")
     external: ExternalFileReference = Field(..., description="外部ファイル")
     caption: list[RichTextItem] = Field(..., description="キャプション")
 
+    @property
+    def url(self) -> str:
+        """外部ファイルのURL"""
+        return self.external.url
 
-class FileMediaContentWithFileAndCaption(BaseModel):
+
+class FileMediaContentWithFileAndCaption(BlockContent):
     """内部ファイルとキャプションを持つメディアコンテンツ"""
 
     type: Literal["file"] = Field("file", description="ファイルタイプ")
     file: InternalFile = Field(..., description="内部ファイル")
     caption: list[RichTextItem] = Field(..., description="キャプション")
 
+    @property
+    def url(self) -> str:
+        """内部ファイルのURL"""
+        return self.file.url
+
 
-MediaContentWithFileAndCaption = (
-    ExternalMediaContentWithFileAndCaption | FileMediaContentWithFileAndCaption
-)
+# `type` で分岐するタグ付きUnion（両方の候補を試さずに済む）
+MediaContentWithFileAndCaption = Annotated[
+    ExternalMediaContentWithFileAndCaption | FileMediaContentWithFileAndCaption,
+    Field(discriminator="type"),
+]
 
 
-class ExternalMediaContentWithFileNameAndCaption(BaseModel):
+class ExternalMediaContentWithFileNameAndCaption(BlockContent):
     """外部ファイル（ファイル名付き）とキャプションを持つメディアコンテンツ"""
 
     type: Literal["external"] = Field("external", description="ファイルタイプ")
@@ -66,8 +78,13 @@ class ExternalMediaContentWithFileNameAndCaption(BaseModel):
     caption: list[RichTextItem] = Field(..., description="キャプション")
     name: StrictStr = Field(..., description="ファイル名")
 
+    @property
+    def url(self) -> str:
+        """外部ファイルのURL"""
+        return self.external.url
+
 
-class FileMediaContentWithFileNameAndCaption(BaseModel):
+class FileMediaContentWithFileNameAndCaption(BlockContent):
     """内部ファイル（ファイル名付き）とキャプションを持つメディアコンテンツ"""
 
     type: Literal["file"] = Field("file", description="ファイルタイプ")
@@ -75,18 +92,33 @@ class FileMediaContentWithFileNameAndCaption(BaseModel):
     caption: list[RichTextItem] = Field(..., description="キャプション")
     name: StrictStr = Field(..., description="ファイル名")
 
+    @property
+    def url(self) -> str:
+        """内部ファイルのURL"""
+        return self.file.url
 
-MediaContentWithFileNameAndCaption = (
-    ExternalMediaContentWithFileNameAndCaption | FileMediaContentWithFileNameAndCaption
-)
 
+MediaContentWithFileNameAndCaption = Annotated[
+    ExternalMediaContentWithFileNameAndCaption
+    | FileMediaContentWithFileNameAndCaption,
+    Field(discriminator="type"),
+]
 
-class MediaContentWithUrl(BaseModel):
+
+class MediaContentWithUrl(BlockContent):
     """URLのみを持つメディアコンテンツ"""
 
     url: StrictStr = Field(..., description="URL")
 
 
+def _caption_of(
+    media: MediaContentWithUrlAndCaption | MediaContentWithFileAndCaption,
+) -> str:
+    """キャプションをMarkdownに変換する（空ならrich_text_to_markdownを呼ばない）"""
+    caption = media.caption
+    return rich_text_to_markdown(caption) if caption else ""
+
+
 # ============================================
 # Media Blocks
 # ============================================
@@ -98,6 +130,11 @@ class EmbedBlock(BaseBlockObject):
     type: Literal["embed"] = Field("embed", description="ブロックタイプ")
     embed: MediaContentWithUrlAndCaption = Field(..., description="埋め込みコンテンツ")
 
+    def to_markdown(self) -> str:
+        """埋め込みブロックをMarkdown形式に変換"""
+        embed = self.embed
+        return f"[Embed: {_caption_of(embed) or embed.url}]({embed.url})"
+
 
 class BookmarkBlock(BaseBlockObject):
     """ブックマークブロック"""
@@ -107,18 +144,35 @@ class BookmarkBlock(BaseBlockObject):
         ..., description="ブックマークコンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """ブックマークブロックをMarkdown形式に変換"""
+        bookmark = self.bookmark
+        return f"[Bookmark: {_caption_of(bookmark) or bookmark.url}]({bookmark.url})"
+
+
 class ImageBlock(BaseBlockObject):
     """画像ブロック"""
 
     type: Literal["image"] = Field("image", description="ブロックタイプ")
     image: MediaContentWithFileAndCaption = Field(..., description="画像コンテンツ")
 
+    def to_markdown(self) -> str:
+        """画像ブロックをMarkdown形式に変換"""
+        image = self.image
+        return f"![{_caption_of(image) or 'image'}]({image.url})"
+
+
 class VideoBlock(BaseBlockObject):
     """動画ブロック"""
 
     type: Literal["video"] = Field("video", description="ブロックタイプ")
     video: MediaContentWithFileAndCaption = Field(..., description="動画コンテンツ")
 
+    def to_markdown(self) -> str:
+        """動画ブロックをMarkdown形式に変換"""
+        video = self.video
+        return f"[Video: {_caption_of(video) or 'video'}]({video.url})"
+
 
 class PdfBlock(BaseBlockObject):
     """PDFブロック"""
@@ -126,6 +180,12 @@ class PdfBlock(BaseBlockObject):
     type: Literal["pdf"] = Field("pdf", description="ブロックタイプ")
     pdf: MediaContentWithFileAndCaption = Field(..., description="PDFコンテンツ")
 
+    def to_markdown(self) -> str:
+        """PDFブロックをMarkdown形式に変換"""
+        pdf = self.pdf
+        return f"[PDF: {_caption_of(pdf) or 'pdf'}]({pdf.url})"
+
+
 class FileBlock(BaseBlockObject):
     """ファイルブロック"""
 
@@ -134,6 +194,11 @@ class FileBlock(BaseBlockObject):
         ..., description="ファイルコンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """ファイルブロックをMarkdown形式に変換（ラベルはファイル名）"""
+        file = self.file
+        return f"[File: {file.name or 'file'}]({file.url})"
+
 
 class AudioBlock(BaseBlockObject):
     """音声ブロック"""
@@ -141,6 +206,11 @@ class AudioBlock(BaseBlockObject):
     type: Literal["audio"] = Field("audio", description="ブロックタイプ")
     audio: MediaContentWithFileAndCaption = Field(..., description="音声コンテンツ")
 
+    def to_markdown(self) -> str:
+        """音声ブロックをMarkdown形式に変換"""
+        audio = self.audio
+        return f"[Audio: {_caption_of(audio) or 'audio'}]({audio.url})"
+
 
 class LinkPreviewBlock(BaseBlockObject):
     """リンクプレビューブロック"""
@@ -149,3 +219,7 @@ class LinkPreviewBlock(BaseBlockObject):
     link_preview: MediaContentWithUrl = Field(
         ..., description="リンクプレビューコンテンツ"
     )
+
+    def to_markdown(self) -> str:
+        """リンクプレビューブロックをMarkdown形式に変換"""
+        return f"[Link Preview]({self.link_preview.url})"
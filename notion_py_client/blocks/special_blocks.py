@@ -8,10 +8,10 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, StrictStr
+from pydantic import Field, StrictStr
 
-from .base import ApiColor, BaseBlockObject
-from ..models.rich_text_item import RichTextItem
+from .base import ApiColor, BaseBlockObject, BlockContent
+from ..models.rich_text_item import RichTextItem, rich_text_to_markdown
 from ..models.icon import NotionIcon
 
 
@@ -115,32 +115,32 @@ CodeLanguage = Literal[
 # ============================================
 
 
-class SyncedBlockContent(BaseModel):
+class SyncedBlockContent(BlockContent):
     """同期ブロックコンテンツ"""
 
     synced_from: SyncedFromBlock | None = Field(None, description="同期元ブロック")
 
 
-class SyncedFromBlock(BaseModel):
+class SyncedFromBlock(BlockContent):
     """同期元ブロック情報"""
 
     type: Literal["block_id"] = Field("block_id", description="タイプ")
     block_id: StrictStr = Field(..., description="ブロックID")
 
 
-class TitleObject(BaseModel):
+class TitleObject(BlockContent):
     """タイトルオブジェクト"""
 
     title: StrictStr = Field(..., description="タイトル")
 
 
-class ExpressionObject(BaseModel):
+class ExpressionObject(BlockContent):
     """数式オブジェクト"""
 
     expression: StrictStr = Field(..., description="数式")
 
 
-class CodeContent(BaseModel):
+class CodeContent(BlockContent):
     """コードコンテンツ"""
 
     rich_text: list[RichTextItem] = Field(..., description="リッチテキスト配列")
@@ -148,7 +148,7 @@ class CodeContent(BaseModel):
     language: CodeLanguage = Field(..., description="プログラミング言語")
 
 
-class CalloutContent(BaseModel):
+class CalloutContent(BlockContent):
     """コールアウトコンテンツ"""
 
     rich_text: list[RichTextItem] = Field(..., description="リッチテキスト配列")
@@ -156,7 +156,7 @@ class CalloutContent(BaseModel):
     icon: NotionIcon | None = Field(None, description="アイコン")
 
 
-class MeetingNotesChildren(BaseModel):
+class MeetingNotesChildren(BlockContent):
     """会議メモの関連ブロックID"""
 
     summary_block_id: StrictStr | None = Field(None, description="要約ブロックID")
@@ -166,7 +166,7 @@ class MeetingNotesChildren(BaseModel):
     )
 
 
-class MeetingNotesCalendarEvent(BaseModel):
+class MeetingNotesCalendarEvent(BlockContent):
     """会議メモのカレンダー情報"""
 
     start_time: StrictStr | None = Field(None, description="開始時刻")
@@ -174,14 +174,14 @@ class MeetingNotesCalendarEvent(BaseModel):
     attendees: list[StrictStr] | None = Field(None, description="参加者のユーザーID")
 
 
-class MeetingNotesRecording(BaseModel):
+class MeetingNotesRecording(BlockContent):
     """会議メモの録音情報"""
 
     start_time: StrictStr | None = Field(None, description="録音開始時刻")
     end_time: StrictStr | None = Field(None, description="録音終了時刻")
 
 
-class MeetingNotesContent(BaseModel):
+class MeetingNotesContent(BlockContent):
     """会議メモコンテンツ"""
 
     title: list[RichTextItem] | None = Field(None, description="会議タイトル")
@@ -204,12 +204,20 @@ class SyncedBlockBlock(BaseBlockObject):
     type: Literal["synced_block"] = Field("synced_block", description="ブロックタイプ")
     synced_block: SyncedBlockContent = Field(..., description="同期ブロックコンテンツ")
 
+    def to_markdown(self) -> str:
+        """同期ブロックをMarkdown形式に変換（内容は子ブロック側にあるため空文字）"""
+        return ""
+
 class ChildPageBlock(BaseBlockObject):
     """子ページブロック"""
 
     type: Literal["child_page"] = Field("child_page", description="ブロックタイプ")
     child_page: TitleObject = Field(..., description="子ページ情報")
 
+    def to_markdown(self) -> str:
+        """子ページブロックをMarkdown形式に変換"""
+        return f"[Page: {self.child_page.title}]"
+
 class ChildDatabaseBlock(BaseBlockObject):
     """子データベースブロック"""
 
@@ -218,24 +226,46 @@ class ChildDatabaseBlock(BaseBlockObject):
     )
     child_database: TitleObject = Field(..., description="子データベース情報")
 
+    def to_markdown(self) -> str:
+        """子データベースブロックをMarkdown形式に変換"""
+        return f"[Database: {self.child_database.title}]"
+
 class EquationBlock(BaseBlockObject):
     """数式ブロック"""
 
     type: Literal["equation"] = Field("equation", description="ブロックタイプ")
     equation: ExpressionObject = Field(..., description="数式")
 
+    def to_markdown(self) -> str:
+        """数式ブロックをMarkdown形式（ディスプレイ数式）に変換"""
+        return f"$$\n{self.equation.expression}\n$$"
+
 class CodeBlock(BaseBlockObject):
     """コードブロック"""
 
     type: Literal["code"] = Field("code", description="ブロックタイプ")
     code: CodeContent = Field(..., description="コードコンテンツ")
 
+    def to_markdown(self) -> str:
+        """コードブロックをMarkdown形式（フェンスドコードブロック）に変換
+
+        コードブロック内では装飾が効かないため、リッチテキストはプレーンテキストで出力する。
+        """
+        text = "".join(item.plain_text for item in self.code.rich_text)
+        return f"```{self.code.language}\n{text}\n```"
+
 class CalloutBlock(BaseBlockObject):
     """コールアウトブロック"""
 
     type: Literal["callout"] = Field("callout", description="ブロックタイプ")
     callout: CalloutContent = Field(..., description="コールアウトコンテンツ")
 
+    def to_markdown(self) -> str:
+        """コールアウトブロックをMarkdown形式（引用）に変換"""
+        icon = self.callout.icon
+        prefix = f"> {icon.emoji} " if icon and icon.emoji else "> "
+        return prefix + rich_text_to_markdown(self.callout.rich_text)
+
 
 class MeetingNotesBlock(BaseBlockObject):
     """会議メモブロック"""
@@ -244,3 +274,10 @@ class MeetingNotesBlock(BaseBlockObject):
         "meeting_notes", description="ブロックタイプ"
     )
     meeting_notes: MeetingNotesContent = Field(..., description="会議メモコンテンツ")
+
+    def to_markdown(self) -> str:
+        """会議メモブロックをMarkdown形式に変換（要約・ノートは子ブロック側にある）"""
+        title = self.meeting_notes.title
+        if title:
+            return f"[Meeting Notes: {rich_text_to_markdown(title)}]"
+        return "[Meeting Notes]"
@@ -6,16 +6,16 @@ Paragraph, Heading1/2/3, BulletedListItem, NumberedListItem, Quote, ToDo, Toggle
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field, StrictBool
+from pydantic import Field, StrictBool
 
-from .base import ApiColor, BaseBlockObject
+from .base import ApiColor, BaseBlockObject, BlockContent
 from ..models.icon import NotionIcon
-from ..models.rich_text_item import RichTextItem
+from ..models.rich_text_item import RichTextItem, rich_text_to_markdown
 
 
-class ContentWithRichTextAndColor(BaseModel):
+class ContentWithRichTextAndColor(BlockContent):
     """リッチテキストとカラーを持つコンテンツ"""
 
     rich_text: list[RichTextItem] = Field(..., description="リッチテキスト配列")
@@ -30,7 +30,7 @@ class ParagraphContent(ContentWithRichTextAndColor):
     )
 
 
-class HeaderContentWithRichTextAndColor(BaseModel):
+class HeaderContentWithRichTextAndColor(BlockContent):
     """ヘッダー用リッチテキストとカラーを持つコンテンツ"""
 
     rich_text: list[RichTextItem] = Field(..., description="リッチテキスト配列")
@@ -49,46 +49,76 @@ class ParagraphBlock(BaseBlockObject):
     type: Literal["paragraph"] = Field("paragraph", description="ブロックタイプ")
     paragraph: ParagraphContent = Field(..., description="段落コンテンツ")
 
+    def to_markdown(self) -> str:
+        """段落ブロックをMarkdown形式に変換"""
+        return rich_text_to_markdown(self.paragraph.rich_text)
+
 
 class Heading1Block(BaseBlockObject):
     """見出し1ブロック"""
 
+    _PREFIX: ClassVar[str] = "# "
+
     type: Literal["heading_1"] = Field("heading_1", description="ブロックタイプ")
     heading_1: HeaderContentWithRichTextAndColor = Field(
         ..., description="見出し1コンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """見出し1ブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.heading_1.rich_text)
+
 
 class Heading2Block(BaseBlockObject):
     """見出し2ブロック"""
 
+    _PREFIX: ClassVar[str] = "## "
+
     type: Literal["heading_2"] = Field("heading_2", description="ブロックタイプ")
     heading_2: HeaderContentWithRichTextAndColor = Field(
         ..., description="見出し2コンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """見出し2ブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.heading_2.rich_text)
+
 
 class Heading3Block(BaseBlockObject):
     """見出し3ブロック"""
 
+    _PREFIX: ClassVar[str] = "### "
+
     type: Literal["heading_3"] = Field("heading_3", description="ブロックタイプ")
     heading_3: HeaderContentWithRichTextAndColor = Field(
         ..., description="見出し3コンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """見出し3ブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.heading_3.rich_text)
+
 
 class Heading4Block(BaseBlockObject):
     """見出し4ブロック"""
 
+    _PREFIX: ClassVar[str] = "#### "
+
     type: Literal["heading_4"] = Field("heading_4", description="ブロックタイプ")
     heading_4: HeaderContentWithRichTextAndColor = Field(
         ..., description="見出し4コンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """見出し4ブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.heading_4.rich_text)
+
 
 class BulletedListItemBlock(BaseBlockObject):
     """箇条書きリストアイテムブロック"""
 
+    _PREFIX: ClassVar[str] = "- "
+
     type: Literal["bulleted_list_item"] = Field(
         "bulleted_list_item", description="ブロックタイプ"
     )
@@ -96,10 +126,16 @@ class BulletedListItemBlock(BaseBlockObject):
         ..., description="箇条書きリストアイテムコンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """箇条書きリストアイテムブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.bulleted_list_item.rich_text)
+
 
 class NumberedListItemBlock(BaseBlockObject):
     """番号付きリストアイテムブロック"""
 
+    _PREFIX: ClassVar[str] = "1. "
+
     type: Literal["numbered_list_item"] = Field(
         "numbered_list_item", description="ブロックタイプ"
     )
@@ -107,15 +143,25 @@ class NumberedListItemBlock(BaseBlockObject):
         ..., description="番号付きリストアイテムコンテンツ"
     )
 
+    def to_markdown(self) -> str:
+        """番号付きリストアイテムブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.numbered_list_item.rich_text)
+
 
 class QuoteBlock(BaseBlockObject):
     """引用ブロック"""
 
+    _PREFIX: ClassVar[str] = "> "
+
     type: Literal["quote"] = Field("quote", description="ブロックタイプ")
     quote: ContentWithRichTextAndColor = Field(..., description="引用コンテンツ")
 
+    def to_markdown(self) -> str:
+        """引用ブロックをMarkdown形式に変換"""
+        return self._PREFIX + rich_text_to_markdown(self.quote.rich_text)
+
 
-class ToDoContent(BaseModel):
+class ToDoContent(BlockContent):
     """ToDoコンテンツ"""
 
     rich_text: list[RichTextItem] = Field(..., description="リッチテキスト配列")
@@ -129,6 +175,11 @@ class ToDoBlock(BaseBlockObject):
     type: Literal["to_do"] = Field("to_do", description="ブロックタイプ")
     to_do: ToDoContent = Field(..., description="ToDoコンテンツ")
 
+    def to_markdown(self) -> str:
+        """ToDoブロックをMarkdown形式（タスクリスト）に変換"""
+        prefix = "- [x] " if self.to_do.checked else "- [ ] "
+        return prefix + rich_text_to_markdown(self.to_do.rich_text)
+
 
 class ToggleBlock(BaseBlockObject):
     """トグルブロック"""
@@ -136,6 +187,14 @@ class ToggleBlock(BaseBlockObject):
     type: Literal["toggle"] = Field("toggle", description="ブロックタイプ")
     toggle: ContentWithRichTextAndColor = Field(..., description="トグルコンテンツ")
 
+    def to_markdown(self) -> str:
+        """トグルブロックをMarkdown形式に変換
+
+        子ブロックは含まないため、見出し部分のみの `<details>` 要素になる。
+        """
+        summary = rich_text_to_markdown(self.toggle.rich_text)
+        return f"<details>\n<summary>{summary}</summary>\n</details>"
+
 
 class TemplateBlock(BaseBlockObject):
     """テンプレートブロック"""
@@ -144,3 +203,7 @@ class TemplateBlock(BaseBlockObject):
     template: ContentWithRichTextAndColor = Field(
         ..., description="テンプレートコンテンツ"
     )
+
+    def to_markdown(self) -> str:
+        """テンプレートブロックをMarkdown形式に変換"""
+        return f"[Template: {rich_text_to_markdown(self.template.rich_text)}]"
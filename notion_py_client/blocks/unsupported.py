@@ -6,12 +6,12 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from .base import BaseBlockObject
+from .base import BaseBlockObject, BlockContent
 
 
-class EmptyObject(BaseModel):
+class EmptyObject(BlockContent):
     """空のオブジェクト"""
 
     pass
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field, StrictBool, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
 
 
 class Annotations(BaseModel):
     """NotionのRichTextのアノテーション情報"""
 
+    model_config = ConfigDict(frozen=True)
+
     bold: StrictBool = Field(..., description="太字かどうか")
     italic: StrictBool = Field(..., description="斜体かどうか")
     strikethrough: StrictBool = Field(..., description="取り消し線かどうか")
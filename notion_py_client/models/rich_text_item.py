@@ -2,13 +2,28 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
 from .primitives import Annotations, Equation, Mention, Text
 
+# 装飾なしのアノテーション。大半のRichTextがこれに該当するため1つのインスタンスを共有する
+_DEFAULT_ANNOTATIONS = Annotations(
+    bold=False,
+    italic=False,
+    strikethrough=False,
+    underline=False,
+    code=False,
+    color="default",
+)
+
 
 class RichTextItem(BaseModel):
-    """NotionのRichText要素"""
+    """NotionのRichText要素
+
+    APIレスポンスから読み取って描画するだけのモデルなのでイミュータブルにしておく。
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     type: Literal["text", "mention", "equation"] = Field(
         ..., description="RichTextタイプ"
@@ -20,21 +35,36 @@ class RichTextItem(BaseModel):
     plain_text: StrictStr = Field(..., description="プレーンテキスト")
     href: StrictStr | None = Field(None, description="リンクURL")
 
+    @field_validator("annotations")
+    @classmethod
+    def _share_default_annotations(cls, value: Annotations) -> Annotations:
+        """装飾なしのアノテーションは共有インスタンスに置き換える（Annotationsは不変）
+
+        型はフィールド注釈で決まっているため、`BaseModel.__eq__` を経由せず
+        フィールド値の辞書だけを比較する。
+        """
+        if value.__dict__ == _DEFAULT_ANNOTATIONS.__dict__:
+            return _DEFAULT_ANNOTATIONS
+        return value
+
     def get_plain_text(self) -> str:
         """RichTextItemのプレーンテキストを取得"""
         return self.plain_text
 
     def to_markdown(self) -> str:
         """RichTextItemをMarkdown形式に変換"""
+        # Read model attributes once; everything below works on locals
+        annotations = self.annotations
+        href = self.href
         text = self.plain_text
 
         # Apply code annotation exclusively (code blocks can't have other formatting)
-        if self.annotations.code:
-            # For code, we only need to escape backticks
-            escaped_text = text.replace("`", "\\`")
+        if annotations.code:
+            # For code, we only need to escape backticks (most spans have none)
+            escaped_text = text.replace("`", "\\`") if "`" in text else text
             text = f"`{escaped_text}`"
-            if self.href:
-                text = f"[{text}]({self.href})"
+            if href:
+                text = f"[{text}]({href})"
             return text
 
         # Preserve leading and trailing spaces while applying formatting
@@ -51,27 +81,36 @@ class RichTextItem(BaseModel):
             trailing_space = text[-1]
             text = text[:-1]
 
-        # Apply bold and italic (combined for better markdown)
-        if text:  # Only apply formatting if there's non-space content
-            if self.annotations.bold and self.annotations.italic:
-                text = f"***{text}***"
-            elif self.annotations.bold:
-                text = f"**{text}**"
-            elif self.annotations.italic:
-                text = f"*{text}*"
-
-            # Apply strikethrough
-            if self.annotations.strikethrough:
-                text = f"~~{text}~~"
-
-        # Apply link
-        if self.href and text:
-            text = f"[{text}]({self.href})"
-
-        # Restore leading and trailing spaces
-        return leading_space + text + trailing_space
+        # Only apply formatting if there's non-space content
+        if not text:
+            return leading_space + trailing_space
+
+        # Bold and italic are combined for better markdown
+        bold = annotations.bold
+        italic = annotations.italic
+        if bold and italic:
+            emphasis = "***"
+        elif bold:
+            emphasis = "**"
+        elif italic:
+            emphasis = "*"
+        else:
+            emphasis = ""
+
+        # Strikethrough wraps the emphasis markers
+        strike = "~~" if annotations.strikethrough else ""
+
+        # Build the whole run at once instead of re-wrapping text per annotation
+        if href:
+            return f"{leading_space}[{strike}{emphasis}{text}{emphasis}{strike}]({href}){trailing_space}"
+        return (
+            f"{leading_space}{strike}{emphasis}{text}{emphasis}{strike}{trailing_space}"
+        )
 
 
 def rich_text_to_markdown(rich_text: list[RichTextItem]) -> str:
     """RichTextItemのリストをMarkdown文字列に変換"""
-    return "".join([item.to_markdown() for item in rich_text])
+    # 空のrich_text（空行の段落など）はjoinを呼ばずに返す
+    if not rich_text:
+        return ""
+    return "".join(map(RichTextItem.to_markdown, rich_text))
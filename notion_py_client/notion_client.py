@@ -18,6 +18,7 @@ from typing import (
 )
 
 from pydantic import TypeAdapter
+from pydantic_core import from_json
 
 import httpx
 
@@ -56,11 +57,27 @@ from .responses.list_response import (
     QueryMeetingNotesResponse,
     CommentObject,
     PartialCommentObject,
+    RequestStatusResponse,
 )
 from .blocks.base import BaseBlockObject, PartialBlock
 from .blocks import BlockObject
 from .models.user import PartialUser, User
 
+# TypeAdapterの構築はスキーマのコンパイルを伴うため、モジュールロード時に一度だけ行う
+_BLOCK_ADAPTER: TypeAdapter[BlockObject] = TypeAdapter(BlockObject)
+_PROPERTY_ITEM_ADAPTER: TypeAdapter[PropertyItemObject] = TypeAdapter(
+    PropertyItemObject
+)
+_USER_ADAPTER: TypeAdapter[User] = TypeAdapter(User)
+
+
+def _request_status(response: Mapping[str, Any]) -> RequestStatusResponse | None:
+    """レスポンスの request_status を検証済みモデルに変換する（なければNone）"""
+    request_status = response.get("request_status")
+    if request_status is None:
+        return None
+    return RequestStatusResponse.model_validate(request_status)
+
 
 # ========== logging ==========
 class LogLevel(Enum):
@@ -273,6 +290,17 @@ class ClientOptions(TypedDict, total=False):
                 "notion_version": "2026-03-11"
             }
         )
+
+        # 並行リクエスト向けのコネクションプール設定
+        # （http2 を使う場合は `pip install httpx[http2]` が必要）
+        client = NotionAsyncClient(
+            auth="secret_xxx",
+            options={
+                "http2": True,
+                "max_connections": 32,
+                "max_keepalive_connections": 32,
+            }
+        )
         ```
     """
 
@@ -282,6 +310,9 @@ class ClientOptions(TypedDict, total=False):
     logger: NotRequired[Logger | None]
     notion_version: NotRequired[str]
     user_agent: NotRequired[str]
+    http2: NotRequired[bool]
+    max_connections: NotRequired[int]
+    max_keepalive_connections: NotRequired[int]
 
 
 # AuthParam type (公式SDKと同じ)
@@ -358,7 +389,17 @@ class NotionAsyncClient:
         self._log_level = opts.get("log_level", LogLevel.WARN)
         self._user_agent = opts.get("user_agent", "notionhq-client-python/0.1.0")
 
-        self._client = httpx.AsyncClient(timeout=self._timeout_ms / 1000)
+        # asyncio.gather などで並行に投げたリクエストが接続を使い回せるよう、
+        # コネクションプールの上限と HTTP/2 の利用を設定可能にする
+        limits = httpx.Limits(
+            max_connections=opts.get("max_connections", 100),
+            max_keepalive_connections=opts.get("max_keepalive_connections", 20),
+        )
+        self._client = httpx.AsyncClient(
+            timeout=self._timeout_ms / 1000,
+            http2=opts.get("http2", False),
+            limits=limits,
+        )
 
         # ------- public API groups（JSに合わせた名前/階層）-------
         self.blocks = _BlocksAPI(self)
@@ -472,10 +513,9 @@ class NotionAsyncClient:
             raise RequestTimeoutError()
 
         text = await response.aread()
-        text_str = text.decode(errors="replace")
 
         if not (200 <= response.status_code < 300):
-            err = build_request_error(response, text_str)
+            err = build_request_error(response, text.decode(errors="replace"))
             self._log(
                 LogLevel.WARN,
                 "request fail",
@@ -491,7 +531,8 @@ class NotionAsyncClient:
             )
             raise err
 
-        data: dict[str, Any] = json.loads(text_str) if text_str else {}
+        # pydantic-coreのパーサでバイト列から直接デコードする（json.loadsより高速）
+        data: dict[str, Any] = from_json(text) if text else {}
         self._log(
             LogLevel.INFO,
             "request success",
@@ -632,8 +673,7 @@ class _BlocksAPI:
 
         # typeフィールドがあれば完全なブロック、なければPartialBlock
         if "type" in response and response.get("type") is not None:
-            block_adapter = TypeAdapter(BlockObject)
-            return block_adapter.validate_python(response)
+            return _BLOCK_ADAPTER.validate_python(response)
         else:
             return PartialBlock(**response)
 
@@ -649,8 +689,7 @@ class _BlocksAPI:
 
         # typeフィールドがあれば完全なブロック、なければPartialBlock
         if "type" in response and response.get("type") is not None:
-            block_adapter = TypeAdapter(BlockObject)
-            return block_adapter.validate_python(response)
+            return _BLOCK_ADAPTER.validate_python(response)
         else:
             return PartialBlock(**response)
 
@@ -668,8 +707,7 @@ class _BlocksAPI:
 
         # typeフィールドがあれば完全なブロック、なければPartialBlock
         if "type" in response and response.get("type") is not None:
-            block_adapter = TypeAdapter(BlockObject)
-            return block_adapter.validate_python(response)
+            return _BLOCK_ADAPTER.validate_python(response)
         else:
             return PartialBlock(**response)
 
@@ -705,18 +743,18 @@ class _BlockChildrenAPI:
             # typeフィールドがあれば完全なブロック、なければPartialBlock
             if "type" in item and item.get("type") is not None:
                 # BlockObjectとしてパース
-                block_adapter = TypeAdapter(BlockObject)
-                results.append(block_adapter.validate_python(item))
+                results.append(_BLOCK_ADAPTER.validate_python(item))
             else:
                 results.append(PartialBlock(**item))
 
-        return ListBlockChildrenResponse(
+        # resultsは検証済みのブロックなので、リスト全体を再検証せずに組み立てる
+        return ListBlockChildrenResponse.model_construct(
             object="list",
             results=results,
             next_cursor=response.get("next_cursor"),
             has_more=response.get("has_more", False),
             type="block",
-            request_status=response.get("request_status"),
+            request_status=_request_status(response),
         )
 
     async def list(
@@ -746,18 +784,18 @@ class _BlockChildrenAPI:
             # typeフィールドがあれば完全なブロック、なければPartialBlock
             if "type" in item and item.get("type") is not None:
                 # BlockObjectとしてパース（Pydanticが自動的に適切なサブクラスを選択）
-                block_adapter = TypeAdapter(BlockObject)
-                results.append(block_adapter.validate_python(item))
+                results.append(_BLOCK_ADAPTER.validate_python(item))
             else:
                 results.append(PartialBlock(**item))
 
-        return ListBlockChildrenResponse(
+        # resultsは検証済みのブロックなので、リスト全体を再検証せずに組み立てる
+        return ListBlockChildrenResponse.model_construct(
             object="list",
             results=results,
             next_cursor=response.get("next_cursor"),
             has_more=response.get("has_more", False),
             type="block",
-            request_status=response.get("request_status"),
+            request_status=_request_status(response),
         )
 
 
@@ -791,19 +829,19 @@ class _MeetingNotesAPI:
         )
 
         results = []
-        block_adapter = TypeAdapter(BlockObject)
         for item in response.get("results", []):
             if "type" in item and item.get("type") is not None:
-                results.append(block_adapter.validate_python(item))
+                results.append(_BLOCK_ADAPTER.validate_python(item))
             else:
                 results.append(PartialBlock(**item))
 
-        return QueryMeetingNotesResponse(
+        # resultsは検証済みのブロックなので、リスト全体を再検証せずに組み立てる
+        return QueryMeetingNotesResponse.model_construct(
             object="list",
             results=results,
             has_more=response.get("has_more", False),
             type=response.get("type"),
-            request_status=response.get("request_status"),
+            request_status=_request_status(response),
         )
 
 
@@ -1430,8 +1468,7 @@ class _PagePropertiesAPI:
         if isinstance(res, dict) and res.get("object") == "list":
             return PropertyItemListResponse.model_validate(res)
         # PropertyItemObject is a Union, use TypeAdapter
-        adapter = TypeAdapter(PropertyItemObject)
-        return adapter.validate_python(res)
+        return _PROPERTY_ITEM_ADAPTER.validate_python(res)
 
 
 class _UsersAPI:
@@ -1449,8 +1486,7 @@ class _UsersAPI:
         res = await self._c.request(path=f"users/{user_id}", method="get", auth=auth)
         # User is a Union (PersonUser | BotUser), use TypeAdapter
         try:
-            adapter = TypeAdapter(User)
-            return adapter.validate_python(res)
+            return _USER_ADAPTER.validate_python(res)
         except Exception:
             return PartialUser.model_validate(res)
 
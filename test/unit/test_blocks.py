@@ -1,14 +1,89 @@
 """Unit tests for block response parsing and block API helpers."""
 
+import typing
+
 import pytest
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
-from notion_py_client.blocks import BlockObject
-from notion_py_client.blocks.layout_blocks import TabBlock
+from notion_py_client.blocks import (
+    BlockObject,
+    block_to_markdown,
+    blocks_to_markdown,
+    render_all,
+)
+from notion_py_client.blocks.base import PartialBlock
+from notion_py_client.blocks.markdown import _RENDERERS
+from notion_py_client.blocks.layout_blocks import (
+    DividerBlock,
+    LinkToPageBlock,
+    TabBlock,
+)
+from notion_py_client.blocks.media_blocks import (
+    ExternalMediaContentWithFileAndCaption,
+    FileMediaContentWithFileAndCaption,
+    ImageBlock,
+)
 from notion_py_client.blocks.special_blocks import MeetingNotesBlock
 from notion_py_client.blocks.text_blocks import Heading4Block, ParagraphBlock
 from notion_py_client.models.icon import IconType
 from notion_py_client.notion_client import NotionAsyncClient
+from notion_py_client.responses.list_response import (
+    ListBlockChildrenResponse,
+    RequestStatusResponse,
+)
+
+
+def _block(block_type: str, content: dict, **overrides) -> dict:
+    """Build a raw block payload as returned by the Notion API."""
+    data = {
+        "object": "block",
+        "id": f"block_{block_type}",
+        "type": block_type,
+        "created_time": "2026-03-30T10:00:00.000Z",
+        "last_edited_time": "2026-03-30T10:00:00.000Z",
+        "created_by": {"object": "user", "id": "user_123"},
+        "last_edited_by": {"object": "user", "id": "user_123"},
+        "parent": {"type": "page_id", "page_id": "page_123"},
+        "has_children": False,
+        "in_trash": False,
+        block_type: content,
+    }
+    data.update(overrides)
+    return data
+
+
+def _rich_text(content: str, **annotations: bool) -> dict:
+    """Build a raw text rich text payload as returned by the Notion API."""
+    return {
+        "type": "text",
+        "text": {"content": content, "link": None},
+        "annotations": {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+            **annotations,
+        },
+        "plain_text": content,
+        "href": None,
+    }
+
+
+_MEDIA_URL = "https://example.com/media"
+
+_CAPTION = [_rich_text("caption")]
+
+
+def _media_source(source: str) -> dict:
+    """Build the external/file part of a media block payload."""
+    if source == "external":
+        return {"type": "external", "external": {"url": _MEDIA_URL}}
+    return {
+        "type": "file",
+        "file": {"url": _MEDIA_URL, "expiry_time": "2026-03-30T11:00:00.000Z"},
+    }
 
 
 class TestMeetingNotesBlocks:
@@ -195,3 +270,420 @@ class TestBlockChildrenAPI:
             "type": "after_block",
             "after_block": {"id": "after_block_123"},
         }
+
+    @pytest.mark.asyncio
+    async def test_list_wraps_parsed_blocks_and_request_status(self):
+        client = NotionAsyncClient(auth="test-token")
+
+        async def fake_request(*, path, method, query=None, auth=None, **kwargs):
+            return {
+                "object": "list",
+                "results": [
+                    _block("divider", {}),
+                    {"object": "block", "id": "block_partial"},
+                ],
+                "next_cursor": "cursor_2",
+                "has_more": True,
+                "type": "block",
+                "block": {},
+                "request_status": {
+                    "type": "incomplete",
+                    "incomplete_reason": "query_result_limit_reached",
+                },
+            }
+
+        client.request = fake_request  # type: ignore[method-assign]
+
+        result = await client.blocks.children.list(block_id="page_123")
+
+        assert isinstance(result, ListBlockChildrenResponse)
+        assert [type(block) for block in result.results] == [
+            DividerBlock,
+            PartialBlock,
+        ]
+        assert result.next_cursor == "cursor_2"
+        assert result.has_more is True
+        assert isinstance(result.request_status, RequestStatusResponse)
+        assert result.request_status.type == "incomplete"
+
+
+class TestBlockImmutability:
+    """Test that fields of parsed blocks cannot be reassigned (frozen is shallow)."""
+
+    def test_block_fields_cannot_be_reassigned(self):
+        data = _block("divider", {})
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        with pytest.raises(ValidationError):
+            result.has_children = True
+
+    def test_block_content_fields_cannot_be_reassigned(self):
+        data = _block("paragraph", {"rich_text": [], "color": "default"})
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        with pytest.raises(ValidationError):
+            result.paragraph.color = "red"
+
+
+class TestBlockDiscriminator:
+    """Test that BlockObject is resolved by its `type` tag."""
+
+    def test_unknown_block_type_is_rejected_by_tag(self):
+        data = _block("not_a_block", {})
+
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(BlockObject).validate_python(data)
+
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
+
+    def test_errors_are_reported_for_the_tagged_variant_only(self):
+        data = _block("divider", {})
+        del data["id"]
+
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(BlockObject).validate_python(data)
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("divider", "id")
+
+
+class TestMediaBlocks:
+    """Test parsing media blocks through the `type` discriminator."""
+
+    def test_parse_external_image(self):
+        data = _block(
+            "image",
+            {
+                "type": "external",
+                "external": {"url": "https://example.com/a.png"},
+                "caption": [],
+            },
+        )
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert isinstance(result, ImageBlock)
+        assert isinstance(result.image, ExternalMediaContentWithFileAndCaption)
+        assert result.image.external.url == "https://example.com/a.png"
+        assert result.image.url == "https://example.com/a.png"
+
+    def test_parse_file_image(self):
+        data = _block(
+            "image",
+            {
+                "type": "file",
+                "file": {
+                    "url": "https://files.example.com/a.png",
+                    "expiry_time": "2026-03-30T11:00:00.000Z",
+                },
+                "caption": [],
+            },
+        )
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert isinstance(result, ImageBlock)
+        assert isinstance(result.image, FileMediaContentWithFileAndCaption)
+        assert result.image.file.url == "https://files.example.com/a.png"
+        assert result.image.url == "https://files.example.com/a.png"
+
+    def test_unknown_media_type_is_rejected_by_tag(self):
+        data = _block("image", {"type": "unknown", "caption": []})
+
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(BlockObject).validate_python(data)
+
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
+
+    def test_image_to_markdown_falls_back_to_default_alt_text(self):
+        data = _block(
+            "image",
+            {
+                "type": "external",
+                "external": {"url": "https://example.com/a.png"},
+                "caption": [],
+            },
+        )
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert result.to_markdown() == "![image](https://example.com/a.png)"
+
+    def test_image_to_markdown_uses_caption(self):
+        data = _block(
+            "image",
+            {
+                "type": "file",
+                "file": {
+                    "url": "https://files.example.com/a.png",
+                    "expiry_time": "2026-03-30T11:00:00.000Z",
+                },
+                "caption": [_rich_text("diagram", bold=True)],
+            },
+        )
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert result.to_markdown() == "![**diagram**](https://files.example.com/a.png)"
+
+    @pytest.mark.parametrize("source", ["external", "file"])
+    @pytest.mark.parametrize("with_caption", [False, True])
+    @pytest.mark.parametrize(
+        ("block_type", "template", "default_label"),
+        [
+            ("image", "![{}]({})", "image"),
+            ("video", "[Video: {}]({})", "video"),
+            ("pdf", "[PDF: {}]({})", "pdf"),
+            ("audio", "[Audio: {}]({})", "audio"),
+        ],
+    )
+    def test_file_media_to_markdown(
+        self,
+        block_type: str,
+        template: str,
+        default_label: str,
+        with_caption: bool,
+        source: str,
+    ):
+        content = _media_source(source)
+        content["caption"] = _CAPTION if with_caption else []
+
+        block = TypeAdapter(BlockObject).validate_python(_block(block_type, content))
+
+        label = "caption" if with_caption else default_label
+        assert block.to_markdown() == template.format(label, _MEDIA_URL)
+        assert block_to_markdown(block) == block.to_markdown()
+
+    @pytest.mark.parametrize("source", ["external", "file"])
+    @pytest.mark.parametrize(
+        ("name", "label"), [("report.pdf", "report.pdf"), ("", "file")]
+    )
+    def test_file_block_uses_name_not_caption(self, name: str, label: str, source: str):
+        content = _media_source(source)
+        content["caption"] = _CAPTION
+        content["name"] = name
+
+        block = TypeAdapter(BlockObject).validate_python(_block("file", content))
+
+        assert block.to_markdown() == f"[File: {label}]({_MEDIA_URL})"
+
+    @pytest.mark.parametrize("with_caption", [False, True])
+    @pytest.mark.parametrize(
+        ("block_type", "kind"), [("embed", "Embed"), ("bookmark", "Bookmark")]
+    )
+    def test_url_media_to_markdown(
+        self, block_type: str, kind: str, with_caption: bool
+    ):
+        content = {
+            "url": _MEDIA_URL,
+            "caption": _CAPTION if with_caption else [],
+        }
+
+        block = TypeAdapter(BlockObject).validate_python(_block(block_type, content))
+
+        label = "caption" if with_caption else _MEDIA_URL
+        assert block.to_markdown() == f"[{kind}: {label}]({_MEDIA_URL})"
+
+
+class TestLinkToPageBlock:
+    """Test link_to_page id formatting."""
+
+    def test_page_link_uses_compact_id(self):
+        data = _block("link_to_page", {"type": "page_id", "page_id": "1234-5678-90ab"})
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert isinstance(result, LinkToPageBlock)
+        assert result.link_to_page.compact_id == "1234567890ab"
+        assert result.to_markdown() == "[Page Link](https://notion.so/1234567890ab)"
+        assert "compact_id" not in result.model_dump()["link_to_page"]
+
+    def test_database_link_uses_compact_id(self):
+        data = _block("link_to_page", {"type": "database_id", "database_id": "abcd-ef"})
+
+        result = TypeAdapter(BlockObject).validate_python(data)
+
+        assert result.to_markdown() == "[Database Link](https://notion.so/abcdef)"
+
+    def test_compact_id_follows_model_copy_update(self):
+        result = TypeAdapter(BlockObject).validate_python(
+            _block("link_to_page", {"type": "page_id", "page_id": "aa-bb"})
+        )
+        assert result.link_to_page.compact_id == "aabb"
+
+        copied = result.model_copy(
+            update={
+                "link_to_page": result.link_to_page.model_copy(
+                    update={"page_id": "cc-dd"}
+                )
+            }
+        )
+
+        assert copied.link_to_page.compact_id == "ccdd"
+        assert copied.to_markdown() == "[Page Link](https://notion.so/ccdd)"
+
+
+class TestBlockToMarkdown:
+    """Test block_to_markdown / blocks_to_markdown dispatch."""
+
+    def test_block_to_markdown_matches_method(self):
+        block = TypeAdapter(BlockObject).validate_python(
+            _block("bookmark", {"url": "https://example.com", "caption": []})
+        )
+
+        assert block_to_markdown(block) == block.to_markdown()
+        assert block_to_markdown(block) == (
+            "[Bookmark: https://example.com](https://example.com)"
+        )
+
+    def test_blocks_to_markdown_renders_in_order(self):
+        adapter = TypeAdapter(BlockObject)
+        blocks = [
+            adapter.validate_python(_block("divider", {})),
+            adapter.validate_python(
+                _block("link_preview", {"url": "https://example.com"})
+            ),
+            adapter.validate_python(_block("equation", {"expression": "e=mc^2"})),
+        ]
+
+        assert blocks_to_markdown(blocks) == [
+            "---",
+            "[Link Preview](https://example.com)",
+            "$$\ne=mc^2\n$$",
+        ]
+
+    def test_render_all_joins_and_skips_partial_blocks(self):
+        adapter = TypeAdapter(BlockObject)
+        results = [
+            adapter.validate_python(_block("divider", {})),
+            PartialBlock(object="block", id="partial_123"),
+            adapter.validate_python(
+                _block("link_preview", {"url": "https://example.com"})
+            ),
+        ]
+
+        assert render_all(results) == "---\n\n[Link Preview](https://example.com)"
+        assert render_all(results, separator="\n") == (
+            "---\n[Link Preview](https://example.com)"
+        )
+
+    @pytest.mark.parametrize(
+        ("block_type", "expected"),
+        [
+            ("heading_1", "# Title"),
+            ("heading_2", "## Title"),
+            ("heading_3", "### Title"),
+            ("heading_4", "#### Title"),
+            ("bulleted_list_item", "- Title"),
+            ("numbered_list_item", "1. Title"),
+            ("quote", "> Title"),
+            ("paragraph", "Title"),
+            ("to_do", "- [ ] Title"),
+            ("toggle", "<details>\n<summary>Title</summary>\n</details>"),
+            ("template", "[Template: Title]"),
+        ],
+    )
+    def test_text_block_prefixes(self, block_type: str, expected: str):
+        content = {
+            "rich_text": [_rich_text("Title")],
+            "color": "default",
+        }
+        if block_type.startswith("heading_"):
+            content["is_toggleable"] = False
+
+        block = TypeAdapter(BlockObject).validate_python(_block(block_type, content))
+
+        assert block.to_markdown() == expected
+        assert block_to_markdown(block) == expected
+
+    def test_checked_to_do_is_ticked(self):
+        block = TypeAdapter(BlockObject).validate_python(
+            _block("to_do", {"rich_text": [], "color": "default", "checked": True})
+        )
+
+        assert block_to_markdown(block) == "- [x] "
+
+    def test_render_all_converts_a_page_and_skips_empty_blocks(self):
+        adapter = TypeAdapter(BlockObject)
+        results = [
+            _block(
+                "heading_1",
+                {
+                    "rich_text": [_rich_text("Title")],
+                    "color": "default",
+                    "is_toggleable": False,
+                },
+            ),
+            _block(
+                "paragraph", {"rich_text": [_rich_text("Body")], "color": "default"}
+            ),
+            _block("column_list", {}),
+            _block(
+                "to_do",
+                {
+                    "rich_text": [_rich_text("Task")],
+                    "color": "default",
+                    "checked": False,
+                },
+            ),
+            _block(
+                "code",
+                {
+                    "rich_text": [_rich_text("print(1)")],
+                    "caption": [],
+                    "language": "python",
+                },
+            ),
+        ]
+
+        markdown = render_all([adapter.validate_python(block) for block in results])
+
+        assert markdown == ("# Title\n\nBody\n\n- [ ] Task\n\n```python\nprint(1)\n```")
+
+    @pytest.mark.parametrize(
+        ("block_type", "content", "expected"),
+        [
+            ("child_page", {"title": "Sub"}, "[Page: Sub]"),
+            ("child_database", {"title": "Tasks"}, "[Database: Tasks]"),
+            ("equation", {"expression": "x^2"}, "$$\nx^2\n$$"),
+            ("synced_block", {"synced_from": None}, ""),
+            ("meeting_notes", {}, "[Meeting Notes]"),
+            (
+                "callout",
+                {
+                    "rich_text": [],
+                    "color": "default",
+                    "icon": {"type": "emoji", "emoji": "💡"},
+                },
+                "> 💡 ",
+            ),
+        ],
+    )
+    def test_special_blocks(self, block_type: str, content: dict, expected: str):
+        block = TypeAdapter(BlockObject).validate_python(_block(block_type, content))
+
+        assert block.to_markdown() == expected
+        assert block_to_markdown(block) == expected
+
+    def test_every_block_type_has_a_renderer(self):
+        union = typing.get_args(BlockObject)[0]
+        block_types = {
+            typing.get_args(cls.model_fields["type"].annotation)[0]
+            for cls in typing.get_args(union)
+        }
+
+        assert block_types == set(_RENDERERS)
+
+    def test_blocks_to_markdown_rejects_partial_blocks(self):
+        with pytest.raises(TypeError, match="partial_123"):
+            blocks_to_markdown([PartialBlock(object="block", id="partial_123")])
+
+    def test_unregistered_block_type_raises(self, monkeypatch):
+        block = TypeAdapter(BlockObject).validate_python(_block("divider", {}))
+        monkeypatch.delitem(_RENDERERS, "divider")
+
+        with pytest.raises(NotImplementedError, match="divider"):
+            block_to_markdown(block)
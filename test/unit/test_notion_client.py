@@ -1,10 +1,15 @@
 """Unit tests for client facade additions and defaults."""
 
+import httpx
 import pytest
 from pydantic import ValidationError
 
 from notion_py_client.blocks.special_blocks import MeetingNotesBlock
-from notion_py_client.notion_client import APIErrorCode, NotionAsyncClient
+from notion_py_client.notion_client import (
+    APIErrorCode,
+    APIResponseError,
+    NotionAsyncClient,
+)
 from notion_py_client.requests.page_requests import (
     MovePageParameters,
     ReplaceContentMarkdownCommand,
@@ -62,6 +67,90 @@ class TestNotionAsyncClientDefaults:
     def test_api_error_code_includes_gateway_timeout(self):
         assert APIErrorCode.GatewayTimeout == "gateway_timeout"
 
+    def test_connection_pool_defaults(self, monkeypatch):
+        captured: dict = {}
+
+        def fake_async_client(**kwargs):
+            captured.update(kwargs)
+
+        monkeypatch.setattr(
+            "notion_py_client.notion_client.httpx.AsyncClient", fake_async_client
+        )
+
+        NotionAsyncClient(auth="test-token")
+
+        assert captured["http2"] is False
+        assert captured["limits"].max_connections == 100
+        assert captured["limits"].max_keepalive_connections == 20
+
+    def test_connection_pool_options_are_passed_to_httpx(self, monkeypatch):
+        captured: dict = {}
+
+        def fake_async_client(**kwargs):
+            captured.update(kwargs)
+
+        monkeypatch.setattr(
+            "notion_py_client.notion_client.httpx.AsyncClient", fake_async_client
+        )
+
+        NotionAsyncClient(
+            auth="test-token",
+            options={
+                "http2": True,
+                "max_connections": 32,
+                "max_keepalive_connections": 16,
+            },
+        )
+
+        assert captured["http2"] is True
+        assert captured["limits"].max_connections == 32
+        assert captured["limits"].max_keepalive_connections == 16
+
+
+class TestRequestDecoding:
+    """Test response body decoding in NotionAsyncClient.request."""
+
+    def _client_with(self, response: httpx.Response) -> NotionAsyncClient:
+        client = NotionAsyncClient(auth="test-token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: response)
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_success_body_is_decoded_from_bytes(self):
+        client = self._client_with(
+            httpx.Response(
+                200,
+                content='{"object": "block", "id": "block_123", "name": "日本語"}'.encode(),
+            )
+        )
+
+        data = await client.request(path="blocks/block_123", method="get")
+
+        assert data == {"object": "block", "id": "block_123", "name": "日本語"}
+
+    @pytest.mark.asyncio
+    async def test_empty_success_body_becomes_empty_dict(self):
+        client = self._client_with(httpx.Response(200, content=b""))
+
+        assert await client.request(path="blocks/block_123", method="delete") == {}
+
+    @pytest.mark.asyncio
+    async def test_error_body_is_raised_as_api_error(self):
+        client = self._client_with(
+            httpx.Response(
+                404,
+                content=b'{"object": "error", "status": 404, '
+                b'"code": "object_not_found", "message": "missing"}',
+            )
+        )
+
+        with pytest.raises(APIResponseError) as exc_info:
+            await client.request(path="blocks/block_123", method="get")
+
+        assert exc_info.value.code == APIErrorCode.ObjectNotFound
+
 
 class TestPageMarkdownAPI:
     """Test page markdown helpers."""
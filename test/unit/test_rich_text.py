@@ -0,0 +1,108 @@
+"""Unit tests for RichTextItem markdown conversion."""
+
+import pytest
+from pydantic import ValidationError
+
+from notion_py_client.models.rich_text_item import (
+    RichTextItem,
+    rich_text_to_markdown,
+)
+
+
+def _item(text: str, href: str | None = None, **annotations: bool) -> RichTextItem:
+    return RichTextItem.model_validate(
+        {
+            "type": "text",
+            "text": {"content": text, "link": None},
+            "annotations": {
+                "bold": False,
+                "italic": False,
+                "strikethrough": False,
+                "underline": False,
+                "code": False,
+                "color": "default",
+                **annotations,
+            },
+            "plain_text": text,
+            "href": href,
+        }
+    )
+
+
+class TestRichTextToMarkdown:
+    """Test RichTextItem.to_markdown / rich_text_to_markdown."""
+
+    @pytest.mark.parametrize(
+        ("item", "expected"),
+        [
+            (_item("plain"), "plain"),
+            (_item(""), ""),
+            (_item(" "), " "),
+            (_item("bold", bold=True), "**bold**"),
+            (_item("it", italic=True), "*it*"),
+            (_item("both", bold=True, italic=True), "***both***"),
+            (_item("gone", strikethrough=True), "~~gone~~"),
+            (_item("all", bold=True, strikethrough=True), "~~**all**~~"),
+            (_item(" padded ", bold=True), " **padded** "),
+            (_item(" ", bold=True), " "),
+            (_item("link", href="https://example.com"), "[link](https://example.com)"),
+            (
+                _item(" link ", href="https://example.com", italic=True),
+                " [*link*](https://example.com) ",
+            ),
+            (_item("a`b", code=True, bold=True), "`a\\`b`"),
+            (
+                _item("c", code=True, href="https://example.com"),
+                "[`c`](https://example.com)",
+            ),
+        ],
+    )
+    def test_item_to_markdown(self, item: RichTextItem, expected: str):
+        assert item.to_markdown() == expected
+
+    def test_rich_text_to_markdown_joins_items(self):
+        rich_text = [_item("Hello "), _item("world", bold=True), _item("!")]
+
+        assert rich_text_to_markdown(rich_text) == "Hello **world**!"
+
+    def test_rich_text_to_markdown_empty(self):
+        assert rich_text_to_markdown([]) == ""
+
+
+class TestRichTextImmutability:
+    """Test that parsed rich text is read-only."""
+
+    def test_rich_text_item_fields_cannot_be_reassigned(self):
+        item = _item("text")
+
+        with pytest.raises(ValidationError):
+            item.plain_text = "changed"
+
+    def test_annotations_fields_cannot_be_reassigned(self):
+        item = _item("text")
+
+        with pytest.raises(ValidationError):
+            item.annotations.bold = True
+
+
+class TestDefaultAnnotationsSharing:
+    """Test that undecorated runs share one Annotations instance."""
+
+    def test_plain_runs_share_annotations(self):
+        first = _item("a")
+        second = _item("b")
+
+        assert first.annotations is second.annotations
+
+    def test_decorated_runs_keep_their_own_annotations(self):
+        plain = _item("a")
+        bold = _item("b", bold=True)
+
+        assert bold.annotations is not plain.annotations
+        assert bold.annotations.bold is True
+        assert plain.annotations.bold is False
+
+    def test_sharing_applies_to_json_input(self):
+        item = RichTextItem.model_validate_json(_item("a").model_dump_json())
+
+        assert item.annotations is _item("b").annotations